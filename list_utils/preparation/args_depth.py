@@ -1,7 +1,16 @@
-from .depth import ensure_uniform_depth, UnwrapPolicy
-from functools import wraps
-from .iterating import enumerate_container, Numerable
-from typing import Literal, Dict
+from .depth import (
+    ensure_uniform_depth,
+    UnwrapPolicy,
+    _ensure_depth_inside_out,
+    _ensure_depth_outside_in,
+)
+from ..validation.type_checks import _kind_table, _ATOM
+from functools import lru_cache, partial, update_wrapper
+from operator import itemgetter
+from types import CodeType, FunctionType
+from weakref import WeakKeyDictionary
+from .iterating import Numerable
+from typing import Any, Literal, Dict, Optional, Tuple
 
 
 def _normalize_depth_spec(depth_spec: Numerable, num_args: int) -> Dict[int, int]:
@@ -46,6 +55,114 @@ def _normalize_depth_spec(depth_spec: Numerable, num_args: int) -> Dict[int, int
         raise TypeError(f"depth must be int, list, or dict, got {type(depth_spec).__name__}")
 
 
+# Uniform inside-out wrappers -> (depth, (str_depth, bytes_depth)), used to
+# fuse stacked decorators.
+_INSIDE_OUT_WRAPPERS = WeakKeyDictionary()
+
+
+def _depth_plan(depth_spec: Numerable) -> Optional[Tuple[Tuple[int, Any], ...]]:
+    """
+    Resolve a list or dict depth spec into (index, depth) pairs in index order.
+
+    Returns None when the spec has to be resolved per call instead
+    (unsupported spec types, or dict keys that are not plain ints).
+    """
+    if isinstance(depth_spec, list):
+        return tuple(enumerate(depth_spec))
+    if isinstance(depth_spec, dict) and all(type(i) is int for i in depth_spec):
+        pairs = [(i, d) for i, d in depth_spec.items() if i >= 0]
+        pairs.sort(key=itemgetter(0))
+        return tuple(pairs)
+    return None
+
+
+# Highest argument index unrolled into a generated wrapper; sparser specs
+# keep the generic wrapper rather than generating very long call expressions.
+_MAX_SPECIALIZED_INDEX = 32
+
+
+@lru_cache(maxsize=256)
+def _depth_wrapper_code(plan: Tuple[Tuple[int, int], ...], inside_out: bool) -> CodeType:
+    """
+    Compile the unrolled wrapper source for a depth plan.
+
+    The code only depends on the plan and the mode (option values are
+    looked up in the namespace it is executed in), so decoration sites that
+    share a spec reuse one compiled code object.
+    """
+    depth_map = dict(plan)
+    if inside_out:
+        call = "_inside_out(args[{}], {}, _str_depth, _bytes_depth)"
+    else:
+        call = (
+            "_outside_in(args[{}], {}, depth_of_dict_values=_depth_of_dict_values, "
+            "unwrap_policy=_unwrap_policy, str_depth=_str_depth, bytes_depth=_bytes_depth)"
+        )
+    size = max(depth_map, default=-1) + 1
+    call_args = [
+        call.format(i, depth_map[i]) if i in depth_map else f"args[{i}]"
+        for i in range(size)
+    ]
+    call_args.append(f"*args[{size}:]")
+    call_args.append("**kwargs")
+    source = (
+        "def wrapper(*args, **kwargs):\n"
+        f"    if len(args) < {size}:\n"
+        "        return _generic(*args, **kwargs)\n"
+        f"    return _func({', '.join(call_args)})\n"
+    )
+    return compile(source, "<enforce_asterisk_args_depth>", "exec")
+
+
+def _specialize_depth_wrapper(
+    func,
+    plan,
+    generic_wrapper,
+    *,
+    inside_out: bool,
+    depth_of_dict_values: bool,
+    unwrap_policy: UnwrapPolicy,
+    str_depth: Literal[0, 1],
+    bytes_depth: Literal[0, 1],
+):
+    """
+    Generate a wrapper with the per-argument depth calls unrolled.
+
+    The depth of every argument index is fixed at decoration time, so the
+    wrapper is compiled as straight-line code that calls the inside-out or
+    outside-in implementation directly, e.g. for depth={0: 2, 2: 1}:
+
+        def wrapper(*args, **kwargs):
+            if len(args) < 3:
+                return _generic(*args, **kwargs)
+            return _func(_outside_in(args[0], 2, ...), args[1],
+                         _outside_in(args[2], 1, ...), *args[3:], **kwargs)
+
+    Calls with fewer positional args than the spec covers go through
+    `generic_wrapper`. Returns None when the plan cannot be baked in (no
+    plan, depths that are not non-negative ints, or indices beyond
+    _MAX_SPECIALIZED_INDEX); those keep ensure_uniform_depth's checks.
+    """
+    if plan is None:
+        return None
+
+    for index, target_depth in plan:
+        if index > _MAX_SPECIALIZED_INDEX or type(target_depth) is not int or target_depth < 0:
+            return None
+
+    namespace = {
+        "_func": func,
+        "_generic": generic_wrapper,
+        "_inside_out": _ensure_depth_inside_out,
+        "_outside_in": _ensure_depth_outside_in,
+        "_depth_of_dict_values": depth_of_dict_values,
+        "_unwrap_policy": unwrap_policy,
+        "_str_depth": str_depth,
+        "_bytes_depth": bytes_depth,
+    }
+    exec(_depth_wrapper_code(plan, bool(inside_out)), namespace)
+    return namespace["wrapper"]
+
 
 def enforce_asterisk_args_depth(
     depth: int | Numerable,
@@ -88,28 +205,53 @@ def enforce_asterisk_args_depth(
             bytes_depth=bytes_depth,
         )
     
+    # normalize(arg, target_depth), with the fixed options bound once in C
+    normalize = partial(
+        ensure_uniform_depth,
+        inside_out=inside_out,
+        depth_of_dict_values=depth_of_dict_values,
+        unwrap_policy=unwrap_policy,
+        str_depth=str_depth,
+        bytes_depth=bytes_depth,
+    )
+
+    plan = _depth_plan(depth)
+
     def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            depth_map = _normalize_depth_spec(depth, len(args))
-            new_args = []
-            for i, arg in enumerate_container(args):
-                if i in depth_map:
-                    target_depth = depth_map[i]
-                    new_arg = ensure_uniform_depth(
-                        arg,
-                        target_depth,
-                        inside_out=inside_out,
-                        depth_of_dict_values=depth_of_dict_values,
-                        unwrap_policy=unwrap_policy,
-                        str_depth=str_depth,
-                        bytes_depth=bytes_depth,
-                    )
-                    new_args.append(new_arg)
-                else:
-                    new_args.append(arg)
-            return func(*new_args, **kwargs)
-        return wrapper
+        if plan == ():
+            # Nothing to normalize (e.g. depth={} or depth=[]); skip the wrapper
+            return func
+        if plan is not None:
+            def generic_wrapper(*args, **kwargs):
+                # Only the planned indices are touched; the rest pass through
+                new_args = list(args)
+                num_args = len(new_args)
+                for i, target_depth in plan:
+                    if i >= num_args:
+                        break
+                    new_args[i] = normalize(new_args[i], target_depth)
+                return func(*new_args, **kwargs)
+        else:
+            def generic_wrapper(*args, **kwargs):
+                # args is always a tuple, so plain enumerate gives the indices
+                depth_map = _normalize_depth_spec(depth, len(args))
+                new_args = [
+                    normalize(arg, depth_map[i]) if i in depth_map else arg
+                    for i, arg in enumerate(args)
+                ]
+                return func(*new_args, **kwargs)
+
+        wrapper = _specialize_depth_wrapper(
+            func,
+            plan,
+            generic_wrapper,
+            inside_out=inside_out,
+            depth_of_dict_values=depth_of_dict_values,
+            unwrap_policy=unwrap_policy,
+            str_depth=str_depth,
+            bytes_depth=bytes_depth,
+        )
+        return update_wrapper(wrapper or generic_wrapper, func)
     return decorator
 
 
@@ -136,21 +278,48 @@ def enforce_asterisk_args_uniform_depth(
         str_depth: Depth to assign to non-empty strings (0 = atomic, 1 = sequence).
         bytes_depth: Depth to assign to non-empty bytes (0 = atomic, 1 = sequence).
     """
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            new_args = [
-                ensure_uniform_depth(
-                    arg,
-                    depth,
-                    inside_out=inside_out,
-                    depth_of_dict_values=depth_of_dict_values,
-                    unwrap_policy=unwrap_policy,
-                    str_depth=str_depth,
-                    bytes_depth=bytes_depth,
+    # Bound once per decorator so each call only pays for the arguments
+    normalize = partial(
+        ensure_uniform_depth,
+        depth=depth,
+        inside_out=inside_out,
+        depth_of_dict_values=depth_of_dict_values,
+        unwrap_policy=unwrap_policy,
+        str_depth=str_depth,
+        bytes_depth=bytes_depth,
+    )
+
+    if depth == 1 and type(depth) is int:
+        # Plain scalars only ever need one list layer at depth 1, whatever
+        # the mode or policy, so they skip ensure_uniform_depth entirely.
+        # Strings and bytes count as scalars here when their depth is 0.
+        kind_of_type = _kind_table(str_depth, bytes_depth).get
+
+        def make_wrapper(func):
+            def wrapper(*args, **kwargs):
+                return func(
+                    *[[arg] if kind_of_type(type(arg)) == _ATOM else normalize(arg) for arg in args],
+                    **kwargs,
                 )
-                for arg in args
-            ]
-            return func(*new_args, **kwargs)
+            return wrapper
+    else:
+        def make_wrapper(func):
+            def wrapper(*args, **kwargs):
+                return func(*map(normalize, args), **kwargs)
+            return wrapper
+
+    # Inside-out to depth d and then to depth D >= d equals going straight to
+    # depth D (same str/bytes options), so such stacks keep only the inner wrapper.
+    fusable = inside_out and type(depth) is int and depth >= 0
+    str_options = (str_depth, bytes_depth)
+
+    def decorator(func):
+        if fusable and type(func) is FunctionType:
+            inner = _INSIDE_OUT_WRAPPERS.get(func)
+            if inner is not None and inner[0] >= depth and inner[1] == str_options:
+                return func
+        wrapper = update_wrapper(make_wrapper(func), func)
+        if fusable:
+            _INSIDE_OUT_WRAPPERS[wrapper] = (depth, str_options)
         return wrapper
     return decorator
\ No newline at end of file
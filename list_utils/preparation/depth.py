@@ -1,15 +1,29 @@
-from ..validation.depth import get_max_depth
-from ..validation.type_checks import is_strict_container
-from typing import Any, List, Literal, Dict, Union
-from enum import Enum, auto
-
+from ..validation.depth import get_max_depth, is_depth_at_least
+from ..validation.type_checks import (
+    _node_kind,
+    _kind_table,
+    _KIND_BY_TYPE,
+    _ATOM,
+    _STR,
+    _BYTES,
+    _CONTAINER,
+)
+from typing import Any, List, Literal, Dict, Optional, Tuple, Union
+from enum import IntEnum
+from itertools import chain
+import operator
+
+
+class UnwrapPolicy(IntEnum):
+    """
+    Policy for unwrapping containers during depth normalization.
 
-class UnwrapPolicy(Enum):
-    """Policy for unwrapping containers during depth normalization."""
-    STRICT = auto()         # Require exactly one item → error otherwise
-    IGNORE_EXTRA = auto()   # Ignore all but first item
-    MERGE = auto()          # Flatten the container into a single merged layer
-    ERROR_ON_EXTRA = auto() # Error only when >1 items (alias of STRICT)
+    An IntEnum, so members hash and compare as plain ints in the dispatch table.
+    """
+    STRICT = 1          # Require exactly one item → error otherwise
+    IGNORE_EXTRA = 2    # Ignore all but first item
+    MERGE = 3           # Flatten the container into a single merged layer
+    ERROR_ON_EXTRA = 4  # Error only when >1 items (alias of STRICT)
 
 
 def shed_layer(obj, ignore_extra: bool = True) -> Any:
@@ -26,7 +40,26 @@ def shed_layer(obj, ignore_extra: bool = True) -> Any:
     Raises:
         ValueError: If container is empty, non-container, or has multiple items (when ignore_extra=False)
     """
-    if not is_strict_container(obj):
+    obj_type = type(obj)
+    # Sequences: index directly instead of building an iterator
+    if obj_type is list or obj_type is tuple:
+        size = len(obj)
+        if size == 0:
+            raise ValueError("Cannot unpack from an empty container")
+        if size > 1 and not ignore_extra:
+            raise ValueError(f"Cannot unpack: container has {size} items")
+        return obj[0]
+
+    # Unordered builtins: the for loop takes the first item without next()/iter()
+    if obj_type is set or obj_type is frozenset or obj_type is dict:
+        size = len(obj)
+        if size > 1 and not ignore_extra:
+            raise ValueError(f"Cannot unpack: container has {size} items")
+        for item in obj:
+            return item
+        raise ValueError("Cannot unpack from an empty container")
+
+    if _node_kind(obj) != _CONTAINER:
         raise ValueError("Cannot unpack from a non-container object")
     
     try:
@@ -61,6 +94,7 @@ def ensure_uniform_depth(
     unwrap_policy: UnwrapPolicy = UnwrapPolicy.STRICT,
     str_depth: Literal[0, 1] = 0,
     bytes_depth: Literal[0, 1] = 0,
+    copy: bool = True,
 ) -> Any:
     """
     Ensure that `x` has exactly `depth` layers of containers.
@@ -75,6 +109,13 @@ def ensure_uniform_depth(
                       Only applies when inside_out=False.
         str_depth: Depth to assign to non-empty strings (0 = atomic, 1 = sequence).
         bytes_depth: Depth to assign to non-empty bytes (0 = atomic, 1 = sequence).
+        copy: If False, lists inside x are fixed in place instead of being
+              copied (other containers are still converted to new lists).
+              x is left untouched when a ValueError is raised. A list that
+              occurs more than once in x is reused at one place and copied
+              at the others. With inside_out=True, a list that is also
+              shared with a part of x kept as-is (below `depth`) may still
+              change there; use copy=True for such inputs.
     
     Returns:
         The input x adjusted to the specified depth.
@@ -95,8 +136,12 @@ def ensure_uniform_depth(
     if depth < 0:
         raise ValueError(f"depth must be >= 0, got {depth}")
 
+    # Plain scalars have depth 0 in every mode; just wrap them.
+    if _kind_table(str_depth, bytes_depth).get(type(x)) == _ATOM:
+        return _wrap_to_depth(x, depth)
+
     if inside_out:
-        return _ensure_depth_inside_out(x, depth, str_depth, bytes_depth)
+        return _ensure_depth_inside_out(x, depth, str_depth, bytes_depth, copy)
 
     return _ensure_depth_outside_in(
         x,
@@ -105,6 +150,7 @@ def ensure_uniform_depth(
         unwrap_policy=unwrap_policy,
         str_depth=str_depth,
         bytes_depth=bytes_depth,
+        copy=copy,
     )
 
 
@@ -116,50 +162,102 @@ def _ensure_depth_inside_out(
     x: Any, 
     depth: int,
     str_depth: Literal[0, 1],
-    bytes_depth: Literal[0, 1]
+    bytes_depth: Literal[0, 1],
+    copy: bool = True,
 ) -> Any:
     """
     Enforce depth from the inside outward. No global depth check.
     
     This version always succeeds unless the object is not unpackable,
     because each node fixes its depth locally.
-    """
-    if depth == 0:
-        # At depth 0 the object is returned as-is.
-        return x
 
-    # Handle strings and bytes according to their configured depth
-    if isinstance(x, str):
-        if str_depth == 0:
-            # String is atomic, wrap it to target depth
-            return _wrap_to_depth(x, depth)
-        else:
-            # String is sequence-like at depth 1, might need additional wrapping
-            if depth == 1:
-                return x
+    Nodes are processed from an explicit stack of (node, depth, parent, index)
+    entries; each result is stored straight into its slot in the parent's
+    (pre-sized) output list, so no recursion or per-level frames are needed.
+    With copy=False, list nodes serve as their own output list. Each reused
+    list's original items are kept, so a list reached again elsewhere in x
+    (which may need a different result there) is rebuilt from them.
+    """
+    root = [x]
+    stack = [(x, depth, root, 0)]
+    push = stack.append
+    pop = stack.pop
+    # Hot-loop globals bound once as locals
+    kind_of_type = _kind_table(str_depth, bytes_depth).get
+    node_kind = _node_kind
+    wrap = _wrap_to_depth
+    # The one-layer shortcuts skip _wrap_to_depth and its int check, so they
+    # only apply to int depths.
+    one = 1 if type(depth) is int else None
+    in_place = not copy
+    originals: Dict[int, tuple] = {}
+    while stack:
+        node, remaining, parent, index = pop()
+        if remaining == 0:
+            # At depth 0 the object is kept as-is (already in its slot).
+            continue
+
+        kind = kind_of_type(type(node))
+        if kind is None:
+            kind = node_kind(node)
+
+        # Handle strings and bytes according to their configured depth
+        if kind == _STR:
+            if str_depth == 0:
+                # String is atomic, wrap it to target depth
+                parent[index] = wrap(node, remaining)
             else:
-                return _wrap_to_depth(x, depth - 1)
-    
-    if isinstance(x, bytes):
-        if bytes_depth == 0:
-            # Bytes is atomic, wrap it to target depth
-            return _wrap_to_depth(x, depth)
-        else:
-            # Bytes is sequence-like at depth 1, might need additional wrapping
-            if depth == 1:
-                return x
+                # String is sequence-like at depth 1, might need additional wrapping
+                parent[index] = wrap(node, remaining - 1)
+            continue
+
+        if kind == _BYTES:
+            if bytes_depth == 0:
+                # Bytes is atomic, wrap it to target depth
+                parent[index] = wrap(node, remaining)
+            else:
+                # Bytes is sequence-like at depth 1, might need additional wrapping
+                parent[index] = wrap(node, remaining - 1)
+            continue
+
+        # Non-container → must wrap until depth is satisfied.
+        if kind == _ATOM:
+            parent[index] = [node] if remaining == one else wrap(node, remaining)
+            continue
+
+        remaining -= 1
+        source = node
+        reuse = False
+        if in_place and type(node) is list:
+            original = originals.get(id(node))
+            if original is None:
+                originals[id(node)] = tuple(node)
+                reuse = True
+            else:
+                source = original
+
+        if remaining == one:
+            # Flat layer of plain scalars (e.g. [1, 2, 3]): every child just
+            # gets one list layer, so build the result in one comprehension.
+            for item in source:
+                if kind_of_type(type(item)) != _ATOM:
+                    break
             else:
-                return _wrap_to_depth(x, depth - 1)
+                out = [[item] for item in source]
+                if reuse:
+                    node[:] = out
+                    out = node
+                parent[index] = out
+                continue
 
-    # Non-container → must wrap until depth is satisfied.
-    if not is_strict_container(x):
-        return _wrap_to_depth(x, depth)
+        # Container → copy into a list, then fix each element with (depth-1)
+        out = node if reuse else list(source)
+        parent[index] = out
+        if remaining:
+            for i, item in enumerate(out):
+                push((item, remaining, out, i))
 
-    # Container → recurse into each element with (depth-1)
-    return [
-        _ensure_depth_inside_out(item, depth - 1, str_depth, bytes_depth)
-        for item in x
-    ]
+    return root[0]
 
 
 # --------------------------------------------------------
@@ -174,17 +272,28 @@ def _ensure_depth_outside_in(
     unwrap_policy: UnwrapPolicy,
     str_depth: Literal[0, 1],
     bytes_depth: Literal[0, 1],
+    copy: bool = True,
 ) -> Any:
     """
     Adjust depth from the outside: uniform structure required.
-    Calls get_max_depth only once and then applies wrapping/unwrapping.
+    Walks the structure only once (measuring depth and building the
+    exact-depth copy together) and then applies wrapping/unwrapping.
+    The walk stops early once x proves deeper than `depth`; only then is
+    the full get_max_depth computed, to count the layers to unwrap.
     """
-    current_depth = get_max_depth(
-        x,
-        str_depth=str_depth,
-        bytes_depth=bytes_depth,
-        depth_of_dict_values=depth_of_dict_values
+    # In-place mode collects its writes and only applies them once the
+    # structure is known to be valid at exactly `depth`.
+    writes = None if copy else []
+    current_depth, fixed, error = _check_and_fix(
+        x, depth, str_depth, bytes_depth, depth_of_dict_values, writes
     )
+    if current_depth > depth:
+        current_depth = get_max_depth(
+            x,
+            str_depth=str_depth,
+            bytes_depth=bytes_depth,
+            depth_of_dict_values=depth_of_dict_values
+        )
 
     # Too shallow → wrap until deep enough
     if current_depth < depth:
@@ -199,8 +308,13 @@ def _ensure_depth_outside_in(
                 f"Cannot reduce depth from {current_depth} to {depth}: {e}"
             ) from e
 
-    # Exact depth → recursively ensure each layer is consistent
-    return _fix_exact_depth(x, depth, str_depth, bytes_depth)
+    # Exact depth → the consistent copy was already built during the walk
+    if error is not None:
+        raise _structure_error(error)
+    if writes:
+        for target, index, value in writes:
+            target[index] = value
+    return fixed
 
 
 # --------------------------------------------------------
@@ -211,8 +325,24 @@ def _wrap_to_depth(x: Any, layers: int) -> Any:
     """
     Wrap x in `layers` list-structures.
     """
-    for _ in range(layers):
-        x = add_list_layer(x)
+    if type(layers) is not int:
+        # As with range(layers), int-likes pass and floats raise TypeError;
+        # zero layers (from a zero depth) need no wrapping either way.
+        if not layers:
+            return x
+        layers = operator.index(layers)
+    # Shallow wraps dominate decorator use; build them as literals.
+    if layers <= 0:
+        return x
+    if layers == 1:
+        return [x]
+    if layers == 2:
+        return [[x]]
+    if layers == 3:
+        return [[[x]]]
+    x = [[[x]]]
+    for _ in range(layers - 3):
+        x = [x]
     return x
 
 
@@ -225,54 +355,101 @@ def _unwrap_to_depth(x: Any, layers: int, policy: UnwrapPolicy) -> Any:
     Unwrap `layers` levels by removing outermost container layers.
     Behavior depends on the unwrap policy.
     """
+    if type(layers) is not int:
+        layers = operator.index(layers)
+    # Resolve the policy once; each layer then calls its specialized unwrapper
+    unwrap = _UNWRAP_IMPLS.get(policy)
+    if unwrap is None:
+        unwrap = _unwrap_unknown
+    elif policy != UnwrapPolicy.MERGE:
+        # Single-item lists/tuples unwrap the same way under every known
+        # policy but MERGE (which re-lists the child), so peel those without
+        # the policy machinery.
+        while layers and (type(x) is list or type(x) is tuple) and len(x) == 1:
+            x = x[0]
+            layers -= 1
     for _ in range(layers):
-        x = _unwrap_one_layer(x, policy)
+        x = unwrap(x, policy)
     return x
 
 
-def _unwrap_one_layer(x: Any, policy: UnwrapPolicy) -> Any:
-    """
-    Remove one container layer according to the specified policy.
-    """
-    if not is_strict_container(x):
+def _check_unwrappable(x: Any) -> None:
+    """Raise if x has no container layer to remove."""
+    if _node_kind(x) != _CONTAINER:
         raise ValueError(f"Cannot unwrap non-container object of type {type(x).__name__}")
 
+
+def _unwrap_strict(x: Any, policy: UnwrapPolicy) -> Any:
+    """
+    STRICT and ERROR_ON_EXTRA: remove a layer holding exactly one item.
+    """
+    _check_unwrappable(x)
     try:
         size = len(x)
     except TypeError:
         # Fallback for iterables without len()
         size = sum(1 for _ in x)
 
-    # STRICT and ERROR_ON_EXTRA handling
-    if policy in (UnwrapPolicy.STRICT, UnwrapPolicy.ERROR_ON_EXTRA):
-        if size != 1:
-            raise ValueError(
-                f"Expected single-item container, found {size} items "
-                f"(unwrap policy: {policy.name})"
-            )
+    if size != 1:
+        raise ValueError(
+            f"Expected single-item container, found {size} items "
+            f"(unwrap policy: {UnwrapPolicy(policy).name})"
+        )
+    return next(iter(x))
+
+
+def _unwrap_ignore_extra(x: Any, policy: UnwrapPolicy) -> Any:
+    """
+    IGNORE_EXTRA: drop everything but the first element.
+    """
+    _check_unwrappable(x)
+    try:
         return next(iter(x))
+    except StopIteration:
+        raise ValueError("Cannot unwrap empty container")
 
-    # IGNORE_EXTRA → drop everything but the first element
-    if policy is UnwrapPolicy.IGNORE_EXTRA:
-        try:
-            return next(iter(x))
-        except StopIteration:
-            raise ValueError("Cannot unwrap empty container")
-
-    # MERGE → flatten the container as a single layer
-    if policy is UnwrapPolicy.MERGE:
-        merged = []
-        for item in x:
-            # If item is a container, extend; else append
-            if is_strict_container(item):
-                merged.extend(item)
-            else:
-                merged.append(item)
-        return merged
 
+def _unwrap_merge(x: Any, policy: UnwrapPolicy) -> Any:
+    """
+    MERGE: flatten the container as a single layer.
+    """
+    _check_unwrappable(x)
+    # Homogeneous list/tuple children (the usual shape) concatenate in C.
+    # Plain loop: layers are small, a generator for all() costs more.
+    for item in x:
+        if type(item) is not list and type(item) is not tuple:
+            break
+    else:
+        return list(chain.from_iterable(x))
+    merged = []
+    extend = merged.extend
+    append = merged.append
+    kind_of_type = _KIND_BY_TYPE.get
+    for item in x:
+        kind = kind_of_type(type(item))
+        if kind is None:
+            kind = _node_kind(item)
+        # If item is a container, extend; else append
+        if kind == _CONTAINER:
+            extend(item)
+        else:
+            append(item)
+    return merged
+
+
+def _unwrap_unknown(x: Any, policy: Any) -> Any:
+    _check_unwrappable(x)
     raise RuntimeError(f"Unknown unwrap policy: {policy}")
 
 
+_UNWRAP_IMPLS = {
+    UnwrapPolicy.STRICT: _unwrap_strict,
+    UnwrapPolicy.ERROR_ON_EXTRA: _unwrap_strict,
+    UnwrapPolicy.IGNORE_EXTRA: _unwrap_ignore_extra,
+    UnwrapPolicy.MERGE: _unwrap_merge,
+}
+
+
 # --------------------------------------------------------
 # Helper: Fix exact depth
 # --------------------------------------------------------
@@ -285,26 +462,154 @@ def _fix_exact_depth(
 ) -> Any:
     """
     Even if depth is correct, children may have wrong depths.
-    Recursively ensure structure is consistent.
+    Ensure structure is consistent, walking an explicit stack of
+    (node, depth, parent, index) entries in left-to-right order.
     """
-    if depth == 0:
-        return x
-    
-    # Handle strings and bytes at their configured depth
-    if isinstance(x, str) and str_depth == 1 and depth == 1:
-        return x
-    if isinstance(x, bytes) and bytes_depth == 1 and depth == 1:
-        return x
+    root = [x]
+    stack = [(x, depth, root, 0)]
+    push = stack.append
+    pop = stack.pop
+    while stack:
+        node, remaining, parent, index = pop()
+        if remaining == 0:
+            # Kept as-is (already in its slot)
+            continue
+
+        kind = _node_kind(node)
+        # Handle strings and bytes at their configured depth
+        if kind == _STR and str_depth == 1 and remaining == 1:
+            continue
+        if kind == _BYTES and bytes_depth == 1 and remaining == 1:
+            continue
+
+        if kind != _CONTAINER:
+            raise _invalid_structure(node, remaining)
+
+        out = list(node)
+        parent[index] = out
+        remaining -= 1
+        for i in range(len(out) - 1, -1, -1):
+            push((out[i], remaining, out, i))
+
+    return root[0]
+
+
+def _check_and_fix(
+    x: Any,
+    depth: int,
+    str_depth: Literal[0, 1],
+    bytes_depth: Literal[0, 1],
+    depth_of_dict_values: bool,
+    writes: Optional[List[Tuple[list, int, Any]]] = None,
+) -> Tuple[int, Any, Any]:
+    """
+    Measure the max depth of x and build its exact-depth copy in one pass.
+
+    Returns (max_depth, fixed, error). `fixed` and `error` mirror what
+    _fix_exact_depth(x, depth, ...) would return or raise; they are only
+    meaningful when max_depth == depth. As soon as x proves deeper than
+    `depth` the walk stops and max_depth is only a lower bound (> depth).
+    `error` is the first (node, depth) pair that breaks the structure (or a
+    ValueError already raised by _fix_exact_depth); build it with
+    _structure_error only when it is actually raised.
+
+    When `writes` is a list, list nodes are reused as their own fixed copy
+    and each element that needs replacing is recorded as a pending
+    (list, index, value) write instead.
+
+    Nodes are processed from an explicit stack of (node, remaining depth,
+    parent, index, owned) entries in left-to-right order. A node's fixed
+    value is stored straight into its slot in the parent's output list when
+    that list is ours (owned), otherwise it is recorded in `writes`.
+    """
+    root = [x]
+    stack = [(x, depth, root, 0, True)]
+    push = stack.append
+    pop = stack.pop
+    # Hot-loop globals bound once as locals
+    kind_of_type = _kind_table(str_depth, bytes_depth).get
+    node_kind = _node_kind
+    in_place = writes is not None
+    best = 0
+    error = None
+    while stack:
+        node, remaining, parent, index, owned = pop()
+        kind = kind_of_type(type(node))
+        if kind is None:
+            kind = node_kind(node)
+
+        if remaining <= 0:
+            # Only whether node adds a layer matters here, not how deep it goes.
+            if (
+                kind == _CONTAINER
+                or (kind == _STR and str_depth)
+                or (kind == _BYTES and bytes_depth)
+            ):
+                return depth + 1, None, None
+            continue
+
+        level = depth - remaining
+        if kind == _STR or kind == _BYTES:
+            if (str_depth if kind == _STR else bytes_depth) == 1:
+                if level + 1 > best:
+                    best = level + 1
+                if remaining == 1:
+                    continue
+            if error is None:
+                error = (node, remaining)
+            continue
+
+        if kind == _ATOM:
+            if error is None:
+                error = (node, remaining)
+            continue
+
+        if depth_of_dict_values and isinstance(node, dict):
+            # Depth is measured over values but the copy is built from keys,
+            # so this node cannot share a single walk.
+            if is_depth_at_least(
+                node, remaining + 1, str_depth, bytes_depth, depth_of_dict_values=True
+            ):
+                return depth + 1, None, None
+            current = level + get_max_depth(
+                node, str_depth, bytes_depth, depth_of_dict_values=True
+            )
+            if current > depth:
+                return current, None, None
+            if current > best:
+                best = current
+            try:
+                value = _fix_exact_depth(node, remaining, str_depth, bytes_depth)
+            except ValueError as e:
+                if error is None:
+                    error = e
+                continue
+        else:
+            if level + 1 > best:
+                best = level + 1
+            reuse = in_place and type(node) is list
+            value = node if reuse else list(node)
+            remaining -= 1
+            for i in range(len(value) - 1, -1, -1):
+                push((value[i], remaining, value, i, not reuse))
 
-    if not is_strict_container(x):
-        raise ValueError(
-            f"Invalid structure: expected container at depth {depth}, "
-            f"got {type(x).__name__}"
-        )
+        if owned:
+            parent[index] = value
+        elif value is not node:
+            writes.append((parent, index, value))
+
+    return best, root[0], error
 
-    return [
-        _fix_exact_depth(item, depth - 1, str_depth, bytes_depth)
-        for item in x
-    ]
 
+def _structure_error(error: Any) -> ValueError:
+    """Build the ValueError for an `error` returned by _check_and_fix."""
+    if isinstance(error, ValueError):
+        return error
+    return _invalid_structure(*error)
 
+
+def _invalid_structure(x: Any, depth: int) -> ValueError:
+    return ValueError(
+        f"Invalid structure: expected container at depth {depth}, "
+        f"got {type(x).__name__}"
+    )
@@ -0,0 +1,32 @@
+import sys
+from functools import partial
+from typing import Any, Iterable, List
+
+from .depth import get_max_depth
+
+
+def get_max_depth_batch(samples: Iterable[Any], str_depth = 0, bytes_depth = 0, *, depth_of_dict_values: bool = False) -> Any:
+    """
+    Determine the maximum depth of each sample in a batch.
+    Equivalent to [get_max_depth(s, ...) for s in samples], with the options
+    bound once and the per-sample loop driven from C.
+    Args:
+        samples: The inputs to check, one depth per item.
+        str_depth: Depth to return when encountering a string (0 = not a container, 1 = treat as container).
+        bytes_depth: Depth to return when encountering bytes (0 = not a container, 1 = treat as container).
+        depth_of_dict_values: If True, iterate over dict values instead of keys when calculating depth.
+    Returns:
+        A list of depths, or an int64 numpy array when samples is a numpy array.
+    """
+    measure = partial(
+        get_max_depth,
+        str_depth=str_depth,
+        bytes_depth=bytes_depth,
+        depth_of_dict_values=depth_of_dict_values,
+    )
+    # numpy is only used if the caller already imported it
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(samples, numpy.ndarray):
+        return numpy.fromiter(map(measure, samples), dtype=numpy.int64, count=len(samples))
+    depths: List[int] = list(map(measure, samples))
+    return depths
@@ -1,11 +1,18 @@
 
 
-from typing import Any
-from .type_checks import is_strict_container
+import sys
+from array import array
+from typing import Any, Dict, Optional, Tuple
+from .type_checks import _node_kind, _kind_table, _STR, _BYTES, _CONTAINER
+
+# Containers get_max_depth enters before it starts tracking shared subtrees;
+# plain trees below this size never pay for the bookkeeping.
+_SHARED_SCAN_BUDGET = 10_000
+
 
 def get_max_depth(x:Any, str_depth = 0, bytes_depth = 0, *, depth_of_dict_values: bool = False) -> int:
     """
-    Recursively determine the maximum depth of nested containers in x.
+    Determine the maximum depth of nested containers in x.
     Strings and bytes are not considered containers for this purpose.
     If you might consider strings or bytes as containers, set str_depth or bytes_depth = 1.
     Args:
@@ -16,20 +23,97 @@ def get_max_depth(x:Any, str_depth = 0, bytes_depth = 0, *, depth_of_dict_values
     Returns:
         The maximum depth of nested containers.
     """
-    if isinstance(x, str):
-        return str_depth
-    if isinstance(x, bytes):
-        return bytes_depth
-    if not is_strict_container(x):
-        return 0
-    
-    # For dicts, optionally iterate over values instead of keys
-    if isinstance(x, dict) and depth_of_dict_values:
-        items = x.values()
-    else:
-        items = x
-    
-    return 1 + max((get_max_depth(item, str_depth, bytes_depth, depth_of_dict_values=depth_of_dict_values) for item in items), default=0)
+    return _get_max_depth(x, str_depth, bytes_depth, depth_of_dict_values)
+
+
+def _shape_depth(x: Any, str_depth, bytes_depth) -> Optional[int]:
+    """
+    Max depth of an array read off its shape, or None to walk it normally.
+
+    Covers array.array and plain numpy.ndarray (numpy is only looked up if
+    the caller already imported it). Object, structured and 0-d numpy arrays
+    are walked element by element.
+    """
+    if type(x) is array:
+        # Flat typed buffer; 'u'/'w' arrays iterate as one-character strings
+        return 1 + str_depth if x.typecode in "uw" and len(x) else 1
+    numpy = sys.modules.get("numpy")
+    if numpy is None or type(x) is not numpy.ndarray:
+        return None
+    kind = x.dtype.kind
+    if x.ndim == 0 or kind == "O" or kind == "V":
+        return None
+    for axis, size in enumerate(x.shape):
+        if size == 0:
+            # Empty along this axis: nothing below it adds depth
+            return axis + 1
+    if kind == "U":
+        return x.ndim + str_depth
+    if kind == "S":
+        return x.ndim + bytes_depth
+    return x.ndim
+
+
+def _get_max_depth(x: Any, str_depth, bytes_depth, depth_of_dict_values: bool) -> int:
+    # Explicit stack of (node, depth of the node's parent layers): no Python
+    # frame per node and no recursion limit on deeply nested inputs.
+    best = 0
+    stack = [(x, 0)]
+    push = stack.append
+    pop = stack.pop
+    kind_of_type = _kind_table(str_depth, bytes_depth).get
+    # Inputs that alias subtrees (DAGs) can have exponentially many paths.
+    # After _SHARED_SCAN_BUDGET containers, each container is recorded by id
+    # with the highest level it was entered at. The entry also holds the node
+    # itself: containers that build their children on demand would otherwise
+    # free them, and a later container could reuse a recorded id.
+    # A node's level counts the containers above it, so it cannot exceed the
+    # number of distinct containers entered unless some container is its own
+    # ancestor: the walk is going round a reference cycle.
+    budget = _SHARED_SCAN_BUDGET
+    seen: Dict[int, Tuple[Any, int]] = {}
+    while stack:
+        node, level = pop()
+        kind = kind_of_type(type(node))
+        if kind is None:
+            kind = _node_kind(node)
+            if kind == _CONTAINER:
+                shape_depth = _shape_depth(node, str_depth, bytes_depth)
+                if shape_depth is not None:
+                    level += shape_depth
+                    if level > best:
+                        best = level
+                    continue
+        if kind == _STR:
+            level += str_depth
+        elif kind == _BYTES:
+            level += bytes_depth
+        elif kind == _CONTAINER:
+            if budget:
+                budget -= 1
+            else:
+                # Past the budget: a container reached again (shared subtree)
+                # at no greater level cannot raise the max, so skip it.
+                key = id(node)
+                entry = seen.get(key)
+                if entry is not None and entry[1] >= level:
+                    continue
+                seen[key] = (node, level)
+                if level > _SHARED_SCAN_BUDGET + len(seen):
+                    raise RecursionError(
+                        "x contains a reference cycle; its depth is unbounded"
+                    )
+            level += 1
+            # For dicts, optionally iterate over values instead of keys
+            if depth_of_dict_values and isinstance(node, dict):
+                items = node.values()
+            else:
+                items = node
+            for item in items:
+                push((item, level))
+        if level > best:
+            best = level
+    return best
 
 def is_depth_at_least(x:Any, depth:int, str_depth = 0, bytes_depth = 0, *, depth_of_dict_values: bool = False) -> bool:
     """
@@ -48,22 +132,44 @@ def is_depth_at_least(x:Any, depth:int, str_depth = 0, bytes_depth = 0, *, depth
     if depth <= 0:
         return True
 
-    if isinstance(x, str):
-        return str_depth >= depth
-    if isinstance(x, bytes):
-        return bytes_depth >= depth
-    if not is_strict_container(x):
-        return False
+    # Explicit stack of (iterator over siblings, depth still required below
+    # them, always >= 1). Siblings are pulled one at a time, so the walk goes
+    # leftmost-first and returns on the first path that reaches the required
+    # depth without ever touching the siblings to its right.
+    stack = [(iter((x,)), depth)]
+    push = stack.append
+    pop = stack.pop
+    kind_of_type = _kind_table(str_depth, bytes_depth).get
+    while stack:
+        nodes, required = stack[-1]
+        for node in nodes:
+            kind = kind_of_type(type(node))
+            if kind is None:
+                kind = _node_kind(node)
+            if kind == _STR:
+                if str_depth >= required:
+                    return True
+                continue
+            if kind == _BYTES:
+                if bytes_depth >= required:
+                    return True
+                continue
+            if kind != _CONTAINER:
+                continue
 
-    # For dicts, optionally iterate over values instead of keys
-    if isinstance(x, dict) and depth_of_dict_values:
-        items = x.values()
-    else:
-        items = x
+            if required == 1:
+                # Last level: any child completes the path, none need visiting.
+                if len(node):
+                    return True
+                continue
 
-    for item in items:
-        if is_depth_at_least(item, depth - 1, str_depth, bytes_depth, depth_of_dict_values=depth_of_dict_values):
-            return True
+            # For dicts, optionally iterate over values instead of keys
+            if depth_of_dict_values and isinstance(node, dict):
+                push((iter(node.values()), required - 1))
+            else:
+                push((iter(node), required - 1))
+            break
+        else:
+            pop()
 
     return False
-
@@ -1,14 +1,91 @@
 
+from abc import get_cache_token
 from collections.abc import Generator, Iterable, Sized
-from typing import Type, Union
+from functools import cache
+from typing import Dict, Type, Union
+
+# Exact types with a known answer, checked before the (slow) ABC isinstance chain.
+# bytearray is deliberately absent: it is Sized and Iterable, hence a container.
+_FAST_CONTAINERS = frozenset({list, tuple, dict, set, frozenset})
+_FAST_ATOMS = frozenset({str, bytes, int, float, complex, bool, type(None), range})
+# Same answers for subclasses, via C-level isinstance on concrete types
+# rather than the ABC __instancecheck__ machinery.
+_CONTAINER_BASES = tuple(_FAST_CONTAINERS)
+_NON_CONTAINER_BASES = (str, bytes)
 
 def is_strict_container(x):
+    t = type(x)
+    if t in _FAST_CONTAINERS:
+        return True
+    if t in _FAST_ATOMS:
+        return False
+    if isinstance(x, _CONTAINER_BASES):
+        return True
+    if isinstance(x, _NON_CONTAINER_BASES):
+        return False
     return (
         isinstance(x, Iterable)
         and isinstance(x, Sized)
         and not isinstance(x, (str, bytes, Generator, range))
     )
 
+# Node kinds for the depth traversals. One type() lookup in _KIND_BY_TYPE
+# replaces the isinstance(str) / isinstance(bytes) / is_strict_container chain
+# for common types; anything else (subclasses included) goes through _node_kind.
+_ATOM, _STR, _BYTES, _CONTAINER = range(4)
+_KIND_BY_TYPE = {t: _CONTAINER for t in _FAST_CONTAINERS}
+_KIND_BY_TYPE.update({t: _ATOM for t in _FAST_ATOMS})
+_KIND_BY_TYPE[str] = _STR
+_KIND_BY_TYPE[bytes] = _BYTES
+
+@cache
+def _kind_table(str_depth, bytes_depth) -> Dict[type, int]:
+    """
+    _KIND_BY_TYPE specialized for one str_depth/bytes_depth setting.
+
+    Strings (bytes) that count as depth 0 behave exactly like atoms in every
+    walk, so they are classified as _ATOM up front and the walks skip the
+    per-node str/bytes branch for the default settings.
+    """
+    table = dict(_KIND_BY_TYPE)
+    if str_depth == 0:
+        table[str] = _ATOM
+    if bytes_depth == 0:
+        table[bytes] = _ATOM
+    return table
+
+# Kinds already worked out for other types (subclasses, user containers...).
+# The ABC answers behind them only change when an ABC gains a registration,
+# which bumps abc's cache token, so the memo is dropped whenever it moves.
+_KIND_CACHE: Dict[type, int] = {}
+_KIND_CACHE_LIMIT = 256
+_kind_cache_token = get_cache_token()
+
+def _node_kind(x) -> int:
+    """Classify x as _STR, _BYTES, _CONTAINER or _ATOM."""
+    global _kind_cache_token
+    t = type(x)
+    kind = _KIND_BY_TYPE.get(t)
+    if kind is not None:
+        return kind
+    token = get_cache_token()
+    if token != _kind_cache_token:
+        _KIND_CACHE.clear()
+        _kind_cache_token = token
+    kind = _KIND_CACHE.get(t)
+    if kind is not None:
+        return kind
+    if isinstance(x, str):
+        kind = _STR
+    elif isinstance(x, bytes):
+        kind = _BYTES
+    else:
+        kind = _CONTAINER if is_strict_container(x) else _ATOM
+    if len(_KIND_CACHE) >= _KIND_CACHE_LIMIT:
+        _KIND_CACHE.clear()
+    _KIND_CACHE[t] = kind
+    return kind
+
 def enlist_type(items: Union[Type, Iterable[Type]]) -> list:
     if isinstance(items, type):
         return [items]
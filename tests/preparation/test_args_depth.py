@@ -172,6 +172,24 @@ class TestEnforceUniformDepth:
         
         assert my_function.__name__ == "my_function"
         assert my_function.__doc__ == "My docstring."
+    
+    def test_uniform_depth_preserves_function_attributes(self):
+        """Qualname, annotations, attributes and __wrapped__ carry over."""
+        def my_function(x: int) -> list:
+            return x
+        my_function.tag = "marked"
+        
+        for decorator in (
+            enforce_asterisk_args_uniform_depth(depth=1),
+            enforce_asterisk_args_uniform_depth(depth=2, inside_out=True),
+            enforce_asterisk_args_depth(depth=[1, 2]),
+            enforce_asterisk_args_depth(depth={0: 1, 5: 2}),
+        ):
+            wrapped = decorator(my_function)
+            assert wrapped.__qualname__ == my_function.__qualname__
+            assert wrapped.__annotations__ == {"x": int, "return": list}
+            assert wrapped.tag == "marked"
+            assert wrapped.__wrapped__ is my_function
 
 
 # ============================================================================
@@ -226,6 +244,28 @@ class TestEnforceVariableDepth:
         result = func("x", "y")
         assert result == [[["x"]], [["y"]]]
     
+    def test_variable_depth_fewer_args_than_spec(self):
+        """Specs covering more args than passed only process those given."""
+        @enforce_asterisk_args_depth(depth=[1, 2, 3])
+        def func(*args):
+            return list(args)
+        
+        assert func("x", "y") == [["x"], [["y"]]]
+        assert func("x", "y", "z", "w") == [["x"], [["y"]], [[["z"]]], "w"]
+    
+    def test_variable_depth_dict_far_index(self):
+        """Indices beyond the unrolled range still reach the right arg."""
+        @enforce_asterisk_args_depth(depth={40: 1, 0: 2})
+        def func(*args):
+            return list(args)
+        
+        args = [str(i) for i in range(42)]
+        result = func(*args)
+        assert result[0] == [["0"]]
+        assert result[40] == ["40"]
+        assert result[1:40] == args[1:40] and result[41] == "41"
+        assert func("a", "b") == [[["a"]], "b"]
+    
     def test_variable_depth_inside_out_mode(self):
         """Inside-out mode with variable depths."""
         @enforce_asterisk_args_depth(depth=[1, 2, 3], inside_out=True)
@@ -255,7 +295,15 @@ class TestEnforceVariableDepth:
         
         result = func("x", "y", "z")
         assert result == ["x", "y", "z"]
-    
+
+    def test_variable_depth_empty_spec_returns_function(self):
+        """Specs that normalize nothing leave the function undecorated."""
+        def func(*args):
+            return list(args)
+
+        assert enforce_asterisk_args_depth(depth={})(func) is func
+        assert enforce_asterisk_args_depth(depth=[])(func) is func
+
     def test_variable_depth_preserves_function_name(self):
         """Decorator preserves original function metadata."""
         @enforce_asterisk_args_depth(depth=[1, 2])
@@ -496,7 +544,24 @@ class TestAdvancedFeatures:
         # inner.wrapper receives [["x"]], normalizes to depth 1 -> ["x"]
         result = func("x")
         assert result == ["x"]  # After both decorators
-    
+
+    def test_nested_inside_out_decorators_fuse(self):
+        """Stacked inside-out decorators collapse when the inner is deeper."""
+        def func(*args):
+            return list(args)
+
+        fused = enforce_asterisk_args_uniform_depth(depth=2, inside_out=True)(
+            enforce_asterisk_args_uniform_depth(depth=3, inside_out=True)(func)
+        )
+        nested = enforce_asterisk_args_uniform_depth(depth=3, inside_out=True)(
+            enforce_asterisk_args_uniform_depth(depth=2, inside_out=True)(func)
+        )
+
+        assert fused.__wrapped__ is func
+        assert nested.__wrapped__ is not func
+        assert fused(1, [2, (3,)]) == [[[[1]]], [[[2]], [[3]]]]
+        assert nested(1, [2, (3,)]) == [[[[1]]], [[[2]], [[3]]]]
+
     def test_decorator_with_return_value(self):
         """Return values are not affected by decorator."""
         @enforce_asterisk_args_uniform_depth(depth=1)
@@ -170,6 +170,15 @@ class TestOutsideInModeStrict:
         
         result = ensure_uniform_depth([[1], [2]], 2, inside_out=False)
         assert result == [[1], [2]]
+    
+    def test_exact_depth_irregular_structure_fails(self):
+        """Irregular structures at the exact target depth are rejected."""
+        with pytest.raises(ValueError, match="Invalid structure"):
+            ensure_uniform_depth([[1], 2], 2, inside_out=False)
+        
+        # The same structure is simply wrapped when it is too shallow
+        result = ensure_uniform_depth([[1], 2], 3, inside_out=False)
+        assert result == [[[1], 2]]
 
 
 # ============================================================================
@@ -311,6 +320,11 @@ class TestEdgeCases:
         with pytest.raises(ValueError, match="depth must be >= 0"):
             ensure_uniform_depth([1, 2], -1)
     
+    def test_unknown_unwrap_policy_raises(self):
+        """Unknown policies are rejected even when every layer is single-item."""
+        with pytest.raises(RuntimeError, match="Unknown unwrap policy"):
+            ensure_uniform_depth([[1]], 1, inside_out=False, unwrap_policy="bogus")
+    
     def test_depth_zero_with_container(self):
         """Depth 0 with container in outside-in mode."""
         # Should try to unwrap, but will fail with STRICT policy
@@ -330,6 +344,34 @@ class TestEdgeCases:
             expected = [expected]
         assert result == expected
     
+    def test_inside_out_beyond_recursion_limit(self):
+        """Inside-out mode does not recurse per nesting level."""
+        deep = 1
+        for _ in range(5000):
+            deep = (deep,)
+        
+        result = ensure_uniform_depth(deep, 5001, inside_out=True)
+        for _ in range(5001):
+            assert type(result) is list and len(result) == 1
+            result = result[0]
+        assert result == 1
+    
+    def test_float_depth_raises_when_wrapping(self):
+        """Depths must be ints wherever layers are added or removed."""
+        with pytest.raises(TypeError):
+            ensure_uniform_depth(5, 1.0)
+        with pytest.raises(TypeError):
+            ensure_uniform_depth([1, 2], 2.0, inside_out=True)
+        with pytest.raises(TypeError):
+            ensure_uniform_depth([[1]], 1.0, inside_out=False)
+
+    def test_self_referential_raises(self):
+        """A container holding itself has no depth to reduce to."""
+        a = []
+        a.append(a)
+        with pytest.raises(RecursionError):
+            ensure_uniform_depth(a, 2, inside_out=False)
+
     def test_tuple_as_container(self):
         """Tuples are treated as containers."""
         result = ensure_uniform_depth((1, 2, 3), 2, inside_out=False)
@@ -350,6 +392,12 @@ class TestEdgeCases:
         result = ensure_uniform_depth("hello", 2, inside_out=False)
         assert result == [["hello"]]
 
+    def test_strings_with_str_depth(self):
+        """str_depth decides whether strings count as a layer."""
+        assert ensure_uniform_depth(["ab", "c"], 2, inside_out=True) == [["ab"], ["c"]]
+        assert ensure_uniform_depth(["ab", "c"], 2, inside_out=True, str_depth=1) == ["ab", "c"]
+        assert ensure_uniform_depth([b"ab", "c"], 2, inside_out=True, bytes_depth=1) == [b"ab", ["c"]]
+
 
 # ============================================================================
 # Tests for complex scenarios
@@ -597,6 +645,63 @@ class TestStringAndBytesDepth:
         assert result == ["a", "b", "c"]
 
 
+# ============================================================================
+# Tests for in-place (copy=False) normalization
+# ============================================================================
+
+class TestInPlace:
+    """Test the copy=False option."""
+    
+    def test_outside_in_fixes_lists_in_place(self):
+        """Lists at exact depth are reused; tuples are replaced in their slot."""
+        inner = [1, 2]
+        data = [inner, (3, 4)]
+        result = ensure_uniform_depth(data, 2, inside_out=False, copy=False)
+        assert result is data
+        assert result[0] is inner
+        assert result == [[1, 2], [3, 4]]
+    
+    def test_inside_out_fixes_lists_in_place(self):
+        """Inside-out wraps elements directly inside the input lists."""
+        data = [1, [2]]
+        result = ensure_uniform_depth(data, 2, inside_out=True, copy=False)
+        assert result is data
+        assert data == [[1], [2]]
+
+    def test_inside_out_flat_scalars_in_place(self):
+        """A flat list of scalars is wrapped element-wise in place."""
+        data = [1, 2.5, None]
+        result = ensure_uniform_depth(data, 2, inside_out=True, copy=False)
+        assert result is data
+        assert data == [[1], [2.5], [None]]
+
+    def test_inside_out_aliased_lists(self):
+        """A list reached at two levels gets the same result as with copy=True."""
+        for make in (
+            lambda inner: [inner, [inner]],
+            lambda inner: [[inner], inner],
+            lambda inner: [inner, inner],
+        ):
+            expected = ensure_uniform_depth(make([1]), 3, inside_out=True)
+            assert ensure_uniform_depth(make([1]), 3, inside_out=True, copy=False) == expected
+        inner = [1]
+        assert ensure_uniform_depth([inner, [inner]], 3, inside_out=True, copy=False) == [[[1]], [[1]]]
+
+    def test_failure_leaves_input_untouched(self):
+        """Invalid structures raise without partially mutating the input."""
+        data = [(1,), 2]
+        with pytest.raises(ValueError, match="Invalid structure"):
+            ensure_uniform_depth(data, 2, inside_out=False, copy=False)
+        assert data == [(1,), 2]
+    
+    def test_copy_default_does_not_mutate(self):
+        """By default the input is copied."""
+        data = [(1,), (2,)]
+        result = ensure_uniform_depth(data, 2, inside_out=False)
+        assert result == [[1], [2]]
+        assert data == [(1,), (2,)]
+
+
 # ============================================================================
 # Tests for ERROR_ON_EXTRA policy
 # ============================================================================
@@ -65,17 +65,7 @@ def is_depth_at_least(x:Any, depth:int, str_depth = 0, bytes_depth = 0, *, depth
 
     return False
 
-class IterCounter:
-    __slots__ = ('count',)
-    def __init__(self):
-        self.count = 0
-    def reset(self):
-        self.count = 0
-    def increment(self):
-        self.count += 1
-
-
-def _iter_test_is_depth_at_least(x:Any, depth:int, str_depth = 0, bytes_depth = 0, *, depth_of_dict_values: bool = False, counter: IterCounter | None = None) -> tuple[bool, int]:
+def _iter_test_is_depth_at_least(x:Any, depth:int, str_depth = 0, bytes_depth = 0, *, depth_of_dict_values: bool = False) -> tuple[bool, int]:
     """
     Check if the depth of nested containers in x is at least the specified depth.
     Strings and bytes are not considered containers for this purpose.
@@ -87,29 +77,39 @@ def _iter_test_is_depth_at_least(x:Any, depth:int, str_depth = 0, bytes_depth =
         bytes_depth: Depth to return when encountering bytes (0 = not a container, 1 = treat as container).
         depth_of_dict_values: If True, iterate over dict values instead of keys when calculating depth.
     Returns:
-        True if the depth of nested containers is at least the specified depth, False otherwise.
+        (result, iterations): whether the depth is at least `depth`, and how
+        many nodes were visited to decide it.
     """
-    if counter is None:
-        counter = IterCounter()
-    counter.increment()
+    # Same leftmost-first order as the recursive version, with one sibling
+    # iterator per level and the visit count kept in a local int.
+    iterations = 0
+    stack = [(iter((x,)), depth)]
+    while stack:
+        nodes, required = stack[-1]
+        for node in nodes:
+            iterations += 1
+            if required <= 0:
+                return True, iterations
 
-    if depth <= 0:
-        return True, counter.count
-    
-    if isinstance(x, str):
-        return str_depth >= depth
-    if isinstance(x, bytes):
-        return bytes_depth >= depth
-    if not is_strict_container(x):
-        return False, counter.count
-    # For dicts, optionally iterate over values instead of keys
-    if isinstance(x, dict) and depth_of_dict_values:
-        items = x.values()
-    else:
-        items = x
+            if isinstance(node, str):
+                if str_depth >= required:
+                    return True, iterations
+                continue
+            if isinstance(node, bytes):
+                if bytes_depth >= required:
+                    return True, iterations
+                continue
+            if not is_strict_container(node):
+                continue
 
-    for item in items:
-        if _iter_test_is_depth_at_least(item, depth - 1, str_depth, bytes_depth, depth_of_dict_values=depth_of_dict_values, counter=counter)[0]:
-            return True, counter.count
+            # For dicts, optionally iterate over values instead of keys
+            if isinstance(node, dict) and depth_of_dict_values:
+                items = node.values()
+            else:
+                items = node
+            stack.append((iter(items), required - 1))
+            break
+        else:
+            stack.pop()
 
-    return False, counter.count
\ No newline at end of file
+    return False, iterations
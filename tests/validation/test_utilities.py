@@ -1,5 +1,6 @@
-
+import pytest
 from ...list_utils.validation.type_checks import is_strict_container
+from ...list_utils.validation import depth as validation_depth
 from .mock_depth import _iter_test_is_depth_at_least, get_max_depth, is_depth_at_least
 
 def test_is_strict_container():
@@ -13,6 +14,20 @@ def test_is_strict_container():
     assert is_strict_container(42) is False
     assert is_strict_container(3.14) is False
     assert is_strict_container(None) is False
+    assert is_strict_container(range(3)) is False
+    assert is_strict_container(x for x in []) is False
+
+    assert is_strict_container(frozenset()) is True
+    assert is_strict_container(bytearray(b"ab")) is True
+
+    class Row(tuple):
+        pass
+
+    class Name(str):
+        pass
+
+    assert is_strict_container(Row((1,))) is True
+    assert is_strict_container(Name("x")) is False
 
 def test_get_max_depth():
     assert get_max_depth(42) == 0
@@ -40,6 +55,130 @@ def test_is_depth_at_least():
     assert is_depth_at_least({'a': [1, 2], 'b': [3, 4]}, 2, depth_of_dict_values=True) is True
     assert is_depth_at_least({'a': [1, 2], 'b': [3, 4]}, 2, depth_of_dict_values=False) is False
 
+def test_depth_beyond_recursion_limit():
+    deep = 1
+    for _ in range(5000):
+        deep = [deep]
+    assert validation_depth.get_max_depth(deep) == 5000
+    assert validation_depth.is_depth_at_least(deep, 5000) is True
+    assert validation_depth.is_depth_at_least(deep, 5001) is False
+
+def test_get_max_depth_shared_subtrees():
+    # 2**40 paths but only 41 distinct lists: must not walk every path
+    shared = [1]
+    for _ in range(40):
+        shared = [shared, shared]
+    assert validation_depth.get_max_depth(shared) == 41
+    assert validation_depth.get_max_depth([shared, [[[[shared]]]]]) == 46
+
+def test_get_max_depth_shared_scan_lazy_children():
+    # Children built on demand are freed after their visit, so their ids can
+    # be handed to containers created later in the walk.
+    class Lazy:
+        def __init__(self, n, make):
+            self.n = n
+            self.make = make
+        def __len__(self):
+            return self.n
+        def __iter__(self):
+            return map(self.make, range(self.n))
+
+    def make_deep(_):
+        a = []
+        a.append([[[1]]])
+        return a
+
+    def make_row(i):
+        return Lazy(1, make_deep if i == 0 else lambda _: [])
+
+    data = Lazy(20_000, make_row)
+    assert validation_depth.get_max_depth(data) == get_max_depth(data) == 6
+
+def test_get_max_depth_reference_cycle():
+    a = []
+    a.append(a)
+    with pytest.raises(RecursionError):
+        validation_depth.get_max_depth(a)
+    d = {}
+    d["k"] = [1, d]
+    with pytest.raises(RecursionError):
+        validation_depth.get_max_depth(d, depth_of_dict_values=True)
+
+def test_get_max_depth_custom_types():
+    from collections.abc import Sized
+
+    class Bag(list):
+        pass
+
+    class Stream:
+        def __iter__(self):
+            return iter([[1]])
+
+    assert validation_depth.get_max_depth(Bag([Bag([1])])) == 2
+    assert validation_depth.get_max_depth(Stream()) == 0
+    # Registering with an ABC changes the answer for types already seen
+    Sized.register(Stream)
+    assert validation_depth.get_max_depth(Stream()) == 2
+
+def test_get_max_depth_typed_arrays():
+    from array import array
+
+    cases = [array('i', [1, 2]), array('i'), array('u', 'ab'), [array('d', [1.0]), [[1]]]]
+    for data in cases:
+        for str_depth in (0, 1):
+            expected = get_max_depth(data, str_depth)
+            assert validation_depth.get_max_depth(data, str_depth) == expected
+
+def test_get_max_depth_batch():
+    from ...list_utils.validation.batch import get_max_depth_batch
+
+    samples = [1, [1], [[1], 2], "ab", ({"k": [1]},)]
+    assert get_max_depth_batch(samples) == [get_max_depth(s) for s in samples]
+    assert get_max_depth_batch(samples, str_depth=1, depth_of_dict_values=True) == [
+        get_max_depth(s, 1, depth_of_dict_values=True) for s in samples
+    ]
+    assert get_max_depth_batch(iter([])) == []
+
+def test_get_max_depth_numpy_arrays():
+    np = pytest.importorskip("numpy")
+
+    ragged = np.empty(2, dtype=object)
+    ragged[0] = [1, [2]]
+    ragged[1] = (3,)
+    grid = np.empty((2, 2), dtype=object)
+    grid[0, 0] = 1
+    grid[0, 1] = "ab"
+    grid[1, 0] = [[2]]
+    grid[1, 1] = None
+    cases = [
+        np.arange(6).reshape(2, 3),
+        np.zeros((2, 3, 4)),
+        np.array([1.5, 2.5]),
+        np.array(["ab", "c"]),
+        np.array([["ab"], [""]]),
+        np.array([b"ab", b"c"]),
+        np.zeros((2, 0, 3)),
+        np.zeros((0, 3)),
+        np.array([], dtype="U1"),
+        ragged,
+        grid,
+        [np.arange(3), [[1]]],
+    ]
+    for data in cases:
+        for str_depth in (0, 1):
+            for bytes_depth in (0, 1):
+                expected = get_max_depth(data, str_depth, bytes_depth)
+                assert validation_depth.get_max_depth(data, str_depth, bytes_depth) == expected
+
+def test_is_depth_at_least_leftmost_first():
+    class Untouchable(list):
+        def __iter__(self):
+            raise AssertionError("right sibling was visited")
+
+    data = [[1], Untouchable([[2]])]
+    assert validation_depth.is_depth_at_least(data, 2) is True
+    assert validation_depth.is_depth_at_least([[], [[1]]], 3) is True
+
 def test_iter_test_stops_early():
     #_iter_test_is_depth_at_least returns value, iterations
     result, iterations = _iter_test_is_depth_at_least([[1, 2], [3, 4]], 2)